@@ -2,6 +2,7 @@
 'Mathematicians Prove the "Omniperiodicity" of Conway's Game of Life':
 https://www.msn.com/en-us/news/technology/mathematicians-prove-the-omniperiodicity-of-conway-s-game-of-life/ar-AA1lrFgu?rc=1&ocid=winp1taskbar&cvid=0e7f5d7057bd4578bc8931ebdc11fe83&ei=13
 '''
+from collections import defaultdict
 import pygame
 import numpy as np
 
@@ -35,49 +36,79 @@ config = GameConfig.get_instance()
 # State pattern for the game state
 class GameState:
     def __init__(self):
-        self.state = np.random.choice([0, 1], size=(config.n_cells_x, config.n_cells_y), p=[0.8, 0.2])
+        n_cells_x, n_cells_y = config.n_cells_x, config.n_cells_y
+        self.state = np.random.choice([0, 1], size=(n_cells_y, n_cells_x), p=[0.8, 0.2]).astype(np.uint8)
+        self._scratch = np.empty_like(self.state)
+        self._padded = np.zeros((n_cells_y + 2, n_cells_x + 2), dtype=np.uint8)
+        self._rows = np.empty((n_cells_y, n_cells_x + 2), dtype=np.uint8)
+        self._n_neighbors = np.empty_like(self.state)
+        # The grid size never changes, so the views the stencil reads and writes are sliced once.
+        padded, rows = self._padded, self._rows
+        self._interior = padded[1:-1, 1:-1]
+        self._row_shifts = (padded[:-2], padded[1:-1], padded[2:])
+        self._col_shifts = (rows[:, :-2], rows[:, 1:-1], rows[:, 2:])
 
     def next_generation(self):
-        new_state = np.copy(self.state)
-        for y in range(config.n_cells_y):
-            for x in range(config.n_cells_x):
-                n_neighbors = self._count_neighbors(x, y)
-                if self.state[x, y] == 1 and (n_neighbors < 2 or n_neighbors > 3):
-                    new_state[x, y] = 0
-                elif self.state[x, y] == 0 and n_neighbors == 3:
-                    new_state[x, y] = 1
-        self.state = new_state
-
-    def _count_neighbors(self, x, y):
-        return sum([self.state[(x + i) % config.n_cells_x, (y + j) % config.n_cells_y]
-                    for i in [-1, 0, 1] for j in [-1, 0, 1] if not (i == 0 and j == 0)])
+        s = self.state
+        # Surround the board with a one-cell halo copied from the opposite edges so the
+        # toroidal neighbors can be read with plain slices.
+        padded = self._padded
+        np.copyto(self._interior, s)
+        padded[1:-1, 0] = s[:, -1]
+        padded[1:-1, -1] = s[:, 0]
+        padded[0] = padded[-2]
+        padded[-1] = padded[1]
+        # The 3x3 neighborhood sum is separable: sum along one axis, then the other.
+        rows = self._rows
+        above, level, below = self._row_shifts
+        np.add(above, level, out=rows)
+        rows += below
+        n_neighbors = self._n_neighbors
+        left, center, right = self._col_shifts
+        np.add(left, center, out=n_neighbors)
+        n_neighbors += right
+        n_neighbors -= s
+        # Write the next generation into the spare buffer and swap, instead of allocating a new board.
+        # A cell lives on if n == 3, or if n == 2 and it is already alive. Cells are 0 or 1,
+        # so both rules fold into the single test n | cell == 3.
+        new_state = self._scratch
+        np.bitwise_or(n_neighbors, s, out=n_neighbors)
+        np.equal(n_neighbors, 3, out=new_state)
+        self.state, self._scratch = new_state, s
 
 # Observer pattern for handling button events
 class EventManager:
     def __init__(self):
-        self.listeners = []
+        # Listeners keyed by the event type they are interested in.
+        self.listeners = defaultdict(list)
 
-    def register(self, listener):
-        self.listeners.append(listener)
+    def register(self, listener, event_type):
+        self.listeners[event_type].append(listener)
 
     def notify(self, event):
-        for listener in self.listeners:
-            listener.update(event)
+        # Returns True if any listener changed what is shown on screen.
+        changed = False
+        for listener in self.listeners.get(event.type, ()):
+            if listener.update(event):
+                changed = True
+        return changed
 
 class Listener:
+    # Returns True if handling the event changed what is shown on screen.
     def update(self, event):
         raise NotImplementedError
 
 # Strategy pattern for different button actions
 class ButtonAction(Listener):
-    def __init__(self, strategy):
+    def __init__(self, strategy, hit_rect):
         self.strategy = strategy
+        self.hit_rect = hit_rect
 
     def update(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            x, y = event.pos
-            if button_x <= x <= button_x + button_width and button_y <= y <= button_y + button_height:
-                self.strategy.execute()
+        if event.type == pygame.MOUSEBUTTONDOWN and self.hit_rect.collidepoint(event.pos):
+            self.strategy.execute()
+            return True
+        return False
 
 class NextGenerationStrategy:
     def __init__(self, game_state):
@@ -88,28 +119,43 @@ class NextGenerationStrategy:
 
 # Adapter pattern for drawing
 class PygameAdapter:
+    # The grid and cell geometry is read from GameConfig once, when the adapter is created.
     def __init__(self, screen):
         self.screen = screen
+        width, height = config.width, config.height
+        cell_width, cell_height = config.cell_width, config.cell_height
+        n_cells_x, n_cells_y = config.n_cells_x, config.n_cells_y
+        # Cells are rendered one pixel per cell into a small surface, then scaled up into an
+        # off-screen surface whose white (dead) pixels are keyed out so the grid shows through.
+        self._palette = np.array([white, black], dtype=np.uint8)
+        self._small_surf = pygame.Surface((n_cells_x, n_cells_y))
+        self._cell_size = (n_cells_x * cell_width, n_cells_y * cell_height)
+        self._cell_surf = pygame.Surface(self._cell_size)
+        self._cell_surf.set_colorkey(white)
+        # The grid never changes, so render it once.
+        self._grid_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for y in range(0, height, cell_height):
+            for x in range(0, width, cell_width):
+                cell = pygame.Rect(x, y, cell_width, cell_height)
+                pygame.draw.rect(self._grid_surf, gray, cell, 1)
+        # Loading the font and rasterizing the button label only need to happen once.
+        self._font = pygame.font.Font(None, 36)
+        self._label = self._font.render("Next Generation", True, black)
 
     def draw_button(self, button_x, button_y, button_width, button_height):
         pygame.draw.rect(self.screen, green, (button_x, button_y, button_width, button_height))
-        font = pygame.font.Font(None, 36)
-        text = font.render("Next Generation", True, black)
-        text_rect = text.get_rect(center=(button_x + button_width // 2, button_y + button_height // 2))
-        self.screen.blit(text, text_rect)
+        text_rect = self._label.get_rect(center=(button_x + button_width // 2, button_y + button_height // 2))
+        self.screen.blit(self._label, text_rect)
 
-    def draw_grid(self, cell_width, cell_height, width, height):
-        for y in range(0, height, cell_height):
-            for x in range(0, width, cell_width):
-                cell = pygame.Rect(x, y, cell_width, cell_height)
-                pygame.draw.rect(self.screen, gray, cell, 1)
+    def draw_grid(self):
+        self.screen.blit(self._grid_surf, (0, 0))
 
-    def draw_cells(self, game_state, cell_width, cell_height):
-        for y in range(config.n_cells_y):
-            for x in range(config.n_cells_x):
-                cell = pygame.Rect(x * cell_width, y * cell_height, cell_width, cell_height)
-                if game_state[x, y] == 1:
-                    pygame.draw.rect(self.screen, black, cell)
+    def draw_cells(self, game_state):
+        # Color the board at cell resolution, scale it up to pixels and blit it in one go.
+        # The board is indexed [y, x]; surfarray pixels are indexed [x, y].
+        pygame.surfarray.blit_array(self._small_surf, self._palette[game_state.T])
+        pygame.transform.scale(self._small_surf, self._cell_size, self._cell_surf)
+        self.screen.blit(self._cell_surf, (0, 0))
 
 # Composite pattern for graphical components
 class GraphicComponent:
@@ -135,7 +181,7 @@ class Grid(GraphicComponent):
         self.adapter = adapter
 
     def draw(self):
-        self.adapter.draw_grid(config.cell_width, config.cell_height, config.width, config.height)
+        self.adapter.draw_grid()
 
 class Cells(GraphicComponent):
     def __init__(self, adapter, game_state):
@@ -143,7 +189,7 @@ class Cells(GraphicComponent):
         self.game_state = game_state
 
     def draw(self):
-        self.adapter.draw_cells(self.game_state.state, config.cell_width, config.cell_height)
+        self.adapter.draw_cells(self.game_state.state)
 
 class Button(GraphicComponent):
     def __init__(self, adapter):
@@ -162,11 +208,16 @@ class GameBuilder:
         self.event_manager = EventManager()
         self.graphic = CompositeGraphic()
 
+    @staticmethod
+    def button_hit_rect():
+        # collidepoint excludes the right and bottom edges; the hit area includes them.
+        return pygame.Rect(button_x, button_y, button_width + 1, button_height + 1)
+
     def build(self):
         adapter = PygameAdapter(self.screen)
         next_gen_strategy = NextGenerationStrategy(self.game_state)
-        button_action = ButtonAction(next_gen_strategy)
-        self.event_manager.register(button_action)
+        button_action = ButtonAction(next_gen_strategy, self.button_hit_rect())
+        self.event_manager.register(button_action, pygame.MOUSEBUTTONDOWN)
 
         grid = Grid(adapter)
         cells = Cells(adapter, self.game_state)
@@ -184,18 +235,28 @@ class Game:
         self.graphic = graphic
         self.event_manager = event_manager
         self.screen = screen
+        self._clock = pygame.time.Clock()
+        self._dirty = True
 
     def run(self):
         running = True
         while running:
-            self.screen.fill(white)
-            self.graphic.draw()
-            pygame.display.flip()
+            # Only redraw when something may have changed on screen.
+            if self._dirty:
+                self.screen.fill(white)
+                self.graphic.draw()
+                pygame.display.flip()
+                self._dirty = False
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-                self.event_manager.notify(event)
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._dirty = True
+                if self.event_manager.notify(event):
+                    self._dirty = True
+
+            self._clock.tick(frame_rate)
 
         pygame.quit()
 
@@ -205,6 +266,9 @@ black = (0, 0, 0)
 gray = (128, 128, 128)
 green = (0, 255, 0)
 
+# Frames per second
+frame_rate = 60
+
 # Button dimensions
 button_width, button_height = 200, 50
 button_x, button_y = (config.width - button_width) // 2, config.height - button_height - 10
@@ -4,7 +4,8 @@ import numpy as np
 from unittest.mock import Mock, patch
 from game_of_life import (
     GameConfig, GameState, EventManager, ButtonAction, NextGenerationStrategy,
-    PygameAdapter, GameBuilder, Grid, Cells, Button, Game, CompositeGraphic
+    PygameAdapter, GameBuilder, Grid, Cells, Button, Game, CompositeGraphic,
+    button_x, button_y, button_width, button_height
 )
 
 class TestGameConfig(unittest.TestCase):
@@ -19,7 +20,8 @@ class TestGameState(unittest.TestCase):
         self.game_state = GameState()
 
     def test_initial_state(self):
-        self.assertEqual(self.game_state.state.shape, (self.config.n_cells_x, self.config.n_cells_y))
+        self.assertEqual(self.game_state.state.shape, (self.config.n_cells_y, self.config.n_cells_x))
+        self.assertEqual(self.game_state.state.dtype, np.uint8)
 
     def test_next_generation(self):
         initial_state = np.copy(self.game_state.state)
@@ -32,28 +34,53 @@ class TestEventManager(unittest.TestCase):
         self.listener = Mock()
 
     def test_register_listener(self):
-        self.event_manager.register(self.listener)
-        self.assertIn(self.listener, self.event_manager.listeners)
+        self.event_manager.register(self.listener, pygame.MOUSEBUTTONDOWN)
+        self.assertIn(self.listener, self.event_manager.listeners[pygame.MOUSEBUTTONDOWN])
 
     def test_notify_listener(self):
-        self.event_manager.register(self.listener)
-        event = Mock()
+        self.event_manager.register(self.listener, pygame.MOUSEBUTTONDOWN)
+        event = Mock(type=pygame.MOUSEBUTTONDOWN)
         self.event_manager.notify(event)
         self.listener.update.assert_called_with(event)
 
+    def test_notify_skips_other_event_types(self):
+        self.event_manager.register(self.listener, pygame.MOUSEBUTTONDOWN)
+        self.event_manager.notify(Mock(type=pygame.MOUSEMOTION))
+        self.listener.update.assert_not_called()
+
 class TestButtonAction(unittest.TestCase):
     def setUp(self):
         self.game_state = Mock()
         self.strategy = NextGenerationStrategy(self.game_state)
-        self.button_action = ButtonAction(self.strategy)
+        # Use the hit area GameBuilder wires into the game.
+        self.button_action = ButtonAction(self.strategy, GameBuilder.button_hit_rect())
 
-    def test_update(self):
+    def click(self, pos):
         event = Mock()
         event.type = pygame.MOUSEBUTTONDOWN
-        event.pos = (400, 590)
+        event.pos = pos
         self.button_action.update(event)
+
+    def test_update(self):
+        self.click((400, 590))
+        self.game_state.next_generation.assert_called_once()
+
+    def test_update_outside_button(self):
+        self.click((10, 10))
+        self.game_state.next_generation.assert_not_called()
+
+    def test_update_on_right_bottom_edge(self):
+        self.click((button_x + button_width, button_y + button_height))
         self.game_state.next_generation.assert_called_once()
 
+    def test_update_past_right_edge(self):
+        self.click((button_x + button_width + 1, button_y + button_height))
+        self.game_state.next_generation.assert_not_called()
+
+    def test_update_past_bottom_edge(self):
+        self.click((button_x + button_width, button_y + button_height + 1))
+        self.game_state.next_generation.assert_not_called()
+
 class TestPygameAdapter(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -72,6 +99,15 @@ class TestPygameAdapter(unittest.TestCase):
         # Assertions can be added here if needed to validate the draw_button functionality
         # For now, we just ensure it runs without errors
 
+    def test_draw_cells(self):
+        config = GameConfig.get_instance()
+        game_state = np.zeros((config.n_cells_y, config.n_cells_x), dtype=np.uint8)
+        game_state[2, 1] = 1
+        self.screen.fill((255, 255, 255))
+        self.adapter.draw_cells(game_state)
+        self.assertEqual(self.screen.get_at((config.cell_width + 1, 2 * config.cell_height + 1)), (0, 0, 0))
+        self.assertEqual(self.screen.get_at((1, 1)), (255, 255, 255))
+
 class TestCompositeGraphic(unittest.TestCase):
     def setUp(self):
         self.composite = CompositeGraphic()
@@ -109,5 +145,25 @@ class TestGame(unittest.TestCase):
                 with patch('pygame.quit'):
                     self.game.run()
 
+    def test_run_redraws_only_after_state_change(self):
+        events = [
+            [Mock(type=pygame.MOUSEMOTION, pos=(10, 10))],
+            [Mock(type=pygame.MOUSEBUTTONDOWN, pos=(10, 10))],
+            [Mock(type=pygame.MOUSEBUTTONDOWN, pos=(button_x + 1, button_y + 1))],
+            [],
+            [Mock(type=pygame.QUIT)],
+        ]
+        flips_seen = []
+        with patch('pygame.display.flip') as mock_flip:
+            def get_events():
+                flips_seen.append(mock_flip.call_count)
+                return events.pop(0)
+            with patch('pygame.event.get', side_effect=get_events):
+                with patch('pygame.quit'):
+                    self.game.run()
+        # Initial draw, no redraw after the mouse motion or a click outside the button,
+        # exactly one after the button click.
+        self.assertEqual(flips_seen, [1, 1, 1, 2, 2])
+
 if __name__ == '__main__':
     unittest.main()